@@ -12,6 +12,7 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import logging
 from dataclasses import dataclass
 from typing import Callable
 
@@ -25,6 +26,8 @@ try:
 except ImportError:
     from cirq.contrib.quirk import QuirkQubitPermutationGate
 
+logger = logging.getLogger(__name__)
+
 
 @dataclass(frozen=True)
 class HomogeneousCircuitStats:
@@ -150,6 +153,7 @@ def validate_well_structured(circuit: cirq.Circuit,
     tot_n_phx = 0
     tot_n_z = 0
     tot_n_syc = 0
+    n_slices_without_phx = 0
     for mom_class in mom_classes:
         if mom_class in [cirq.PhasedXPowGate, cirq.ZPowGate, cg.SycamoreGate]:
             if hit_permutation:
@@ -172,7 +176,7 @@ def validate_well_structured(circuit: cirq.Circuit,
             if num_z > 1:
                 raise BadlyStructuredCircuitError("Too many Z in this slice")
             if num_phx < 1:
-                print("Warning: no PhX in this slice")
+                n_slices_without_phx += 1
 
             num_phx = 0
             num_z = 0
@@ -195,6 +199,9 @@ def validate_well_structured(circuit: cirq.Circuit,
         else:
             raise BadlyStructuredCircuitError("Unknown moment class")
 
+    if n_slices_without_phx > 0:
+        logger.warning("No PhX in %d slice(s)", n_slices_without_phx)
+
     return mom_classes, HomogeneousCircuitStats(tot_n_phx, tot_n_z, tot_n_syc,
                                                 hit_permutation,
                                                 hit_measurement)
@@ -1,3 +1,4 @@
+import asyncio
 import os
 import time
 import timeit
@@ -137,11 +138,11 @@ async def collect_p1_landscape_data(
 
     t0 = timeit.default_timer()
     circuit.program_id = task.fn
-    unmodified_result = await sampler.run_async(program=circuit,
-                                                repetitions=unmodified_n_shots)
-    circuit.program_id = task.fn + '-flip'
-    flipped_result = await sampler.run_async(program=flipped_circuit,
-                                             repetitions=flipped_n_shots)
+    flipped_circuit.program_id = task.fn + '-flip'
+    # Submit both halves together so their queueing latencies overlap.
+    unmodified_result, flipped_result = await asyncio.gather(
+        sampler.run_async(program=circuit, repetitions=unmodified_n_shots),
+        sampler.run_async(program=flipped_circuit, repetitions=flipped_n_shots))
     t1 = timeit.default_timer()
     result = unmodified_result + flipped_result
     execution_time = t1 - t0
@@ -232,8 +233,9 @@ async def _estimate_single_qubit_readout_errors_async(
         ones_circuit = cirq.Circuit(cirq.X.on_each(*qubits),
                                     cirq.measure_each(*qubits, key_func=repr))
 
-        zeros_result = await sampler.run_async(zeros_circuit, repetitions=repetitions)
-        ones_result = await sampler.run_async(ones_circuit, repetitions=repetitions)
+        zeros_result, ones_result = await asyncio.gather(
+            sampler.run_async(zeros_circuit, repetitions=repetitions),
+            sampler.run_async(ones_circuit, repetitions=repetitions))
 
         zero_state_errors = {
             q: np.mean(zeros_result.measurements[repr(q)]) for q in qubits
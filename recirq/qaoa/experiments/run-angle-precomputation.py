@@ -12,6 +12,8 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import multiprocessing
+
 import recirq
 from recirq.qaoa.experiments.angle_precomputation_tasks import AnglePrecomputationTask, \
     precompute_angles
@@ -50,6 +52,9 @@ def main():
         for i in range(10)
     ]
 
+    # Must match the default `p_max=5` of `_get_optima`, which optimizes every
+    # p up to p_max in one go; see the `chunksize` note below.
+    ps = range(1, 5 + 1)
     precompute_tasks = [
         AnglePrecomputationTask(
             dataset_id='2020-03-23',
@@ -59,11 +64,21 @@ def main():
             hardware_grid_tasks,
             sk_problem_tasks,
             three_regular_tasks)
-        for p in range(1, 5 + 1)
+        for p in ps
     ]
 
-    for task in precompute_tasks:
-        precompute_angles(task)
+    # Each problem is independent, so optimize them in parallel. A chunk
+    # holds every p-value for one generation task so the optimization
+    # cached in `_get_optima` is shared within a single worker process.
+    #
+    # Keep `num_processors` small: each worker holds a (2**n, 2p+2) complex128
+    # array in `ising_qaoa_grad`, which is ~0.8-1.6 GB for the 22-23 qubit
+    # problems at p=5, and roundrobin spreads those across all workers.
+    # numpy may also use several BLAS threads per process; consider setting
+    # OMP_NUM_THREADS=1 when increasing this.
+    num_processors = 2
+    with multiprocessing.Pool(num_processors) as pool:
+        pool.map(precompute_angles, precompute_tasks, chunksize=len(ps))
 
 
 if __name__ == '__main__':
@@ -1,4 +1,5 @@
 from collections import defaultdict
+from functools import lru_cache
 from typing import Sequence, List, Optional, Tuple, Dict, Iterator
 
 import networkx as nx
@@ -225,10 +226,10 @@ def _hardware_graph(problem_graph: nx.Graph, gamma: float,
         for row in range(row_start + row_start_offset, row_end + row_end_offset, row_step):
             for col in range(col_start + col_start_offset, col_end + col_end_offset, col_step):
                 coord1 = (row, col)
-                if coord1 not in node_coordinates:
+                if coord1 not in coord_to_i:
                     continue
                 coord2 = get_neighbor(row, col)
-                if coord2 not in node_coordinates:
+                if coord2 not in coord_to_i:
                     continue
                 node1 = coord_to_i[coord1]
                 node2 = coord_to_i[coord2]
@@ -556,22 +557,50 @@ def compile_single_qubit_gates(
     return c2
 
 
-def zzswap_as_syc(theta: float, q0: cirq.Qid, q1: cirq.Qid) -> cirq.Circuit:
-    """Return a composite Exp[i theta ZZ] SWAP circuit with three SYC gates."""
-    swz = cirq.Circuit(swap_rzz(theta, q0, q1))
+def _on_qubits(circuit: cirq.Circuit, q0: cirq.Qid, q1: cirq.Qid) -> cirq.Circuit:
+    """Return a copy of a two-qubit circuit on LineQubit(0), LineQubit(1)
+    with those qubits replaced by q0 and q1."""
+    qubit_map = dict(zip(cirq.LineQubit.range(2), (q0, q1)))
+    return circuit.transform_qubits(lambda q: qubit_map[q])
+
+
+@lru_cache()
+def _zzswap_as_syc_line_qubits(theta: float) -> cirq.Circuit:
+    swz = cirq.Circuit(swap_rzz(theta, *cirq.LineQubit.range(2)))
     _SingleQubitGates().optimize_circuit(swz)
     cirq.DropEmptyMoments().optimize_circuit(swz)
     return swz
 
 
-def zz_as_syc(theta: float, q0: cirq.Qid, q1: cirq.Qid) -> cirq.Circuit:
-    """Return an Exp[i theta ZZ] circuit with two SYC gates."""
-    swz = cirq.Circuit(rzz(theta, q0, q1))
+@lru_cache()
+def _zz_as_syc_line_qubits(theta: float) -> cirq.Circuit:
+    swz = cirq.Circuit(rzz(theta, *cirq.LineQubit.range(2)))
     _SingleQubitGates().optimize_circuit(swz)
     cirq.DropEmptyMoments().optimize_circuit(swz)
     return swz
 
 
+def zzswap_as_syc(theta: float, q0: cirq.Qid, q1: cirq.Qid) -> cirq.Circuit:
+    """Return a composite Exp[i theta ZZ] SWAP circuit with three SYC gates.
+
+    The decomposition only depends on theta, so it is computed once per
+    angle and cached. Compiled QAOA circuits typically only have a handful
+    of distinct angles. `theta` must therefore be numeric; symbolic angles
+    are not supported.
+    """
+    return _on_qubits(_zzswap_as_syc_line_qubits(float(theta)), q0, q1)
+
+
+def zz_as_syc(theta: float, q0: cirq.Qid, q1: cirq.Qid) -> cirq.Circuit:
+    """Return an Exp[i theta ZZ] circuit with two SYC gates.
+
+    The decomposition only depends on theta, so it is computed once per
+    angle and cached. `theta` must therefore be numeric; symbolic angles
+    are not supported.
+    """
+    return _on_qubits(_zz_as_syc_line_qubits(float(theta)), q0, q1)
+
+
 class _TwoQubitOperationsAsSYC(cirq.PointOptimizer):
     """Optimizer to compile ZZSwap and ZZPowGate gates into SYC."""
 
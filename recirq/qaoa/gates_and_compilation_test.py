@@ -19,7 +19,7 @@ from recirq.qaoa.gates_and_compilation import ZZSwap, compile_problem_unitary_to
     single_qubit_matrix_to_phased_x_z_const_depth, zzswap_as_syc, zz_as_syc, \
     compile_driver_unitary_to_rx, compile_single_qubit_gates, compile_to_syc, \
     measure_with_final_permutation, compile_out_virtual_z, compile_to_non_negligible, \
-    _hardware_graph, compile_problem_unitary_to_hardware_graph
+    _hardware_graph, compile_problem_unitary_to_hardware_graph, swap_rzz
 
 from recirq.qaoa.problems import random_plus_minus_1_weights
 
@@ -278,6 +278,26 @@ def test_zzswap_as_syc():
     cirq.testing.assert_allclose_up_to_global_phase(u1, u2, atol=1e-8)
 
 
+def test_zzswap_as_syc_cached_on_reversed_qubits():
+    # Qubits in reverse sort order, as happens along the SK swap network
+    q1, q2 = cirq.GridQubit(5, 4), cirq.GridQubit(5, 3)
+    zzs = ZZSwap(zz_exponent=0.3)
+    circuit = zzswap_as_syc(zzs.theta, q1, q2)
+    assert circuit.all_qubits() == {q1, q2}
+    assert zzswap_as_syc(zzs.theta, q1, q2) == circuit
+    assert zzswap_as_syc(zzs.theta, q1, q2) is not circuit
+
+    u1 = cirq.Circuit(zzs.on(q1, q2)).unitary(qubit_order=[q1, q2])
+    u2 = circuit.unitary(qubit_order=[q1, q2])
+    cirq.testing.assert_allclose_up_to_global_phase(u1, u2, atol=1e-8)
+
+    # ZZSwap is symmetric, so also check gate-for-gate against the uncached
+    # decomposition built directly on the caller's qubits.
+    uncached = compile_single_qubit_gates(
+        cirq.Circuit(swap_rzz(zzs.theta, q1, q2)))
+    assert circuit == uncached
+
+
 @pytest.mark.skip(msg="KAK instability")
 def test_zzswap_as_syc_2():
     q1, q2 = cirq.LineQubit.range(2)
@@ -301,6 +321,21 @@ def test_zz_as_syc():
     cirq.testing.assert_allclose_up_to_global_phase(u1, u2, atol=1e-8)
 
 
+def test_zz_as_syc_cached_on_other_qubits():
+    q1, q2 = cirq.GridQubit.rect(1, 2)
+    zz = cirq.ZZPowGate(exponent=0.3)
+    theta = zz.exponent * np.pi / 2
+    circuit = zz_as_syc(theta, q1, q2)
+    assert circuit.all_qubits() == {q1, q2}
+    assert zz_as_syc(theta, q1, q2) == circuit
+    assert zz_as_syc(theta, q1, q2) is not circuit
+
+    swapped = zz_as_syc(theta, q2, q1)
+    u1 = cirq.unitary(circuit)
+    u2 = swapped.unitary(qubit_order=[q1, q2])
+    cirq.testing.assert_allclose_up_to_global_phase(u1, u2, atol=1e-8)
+
+
 @pytest.mark.skip(msg="KAK instability")
 def test_zz_as_syc_2():
     q1, q2 = cirq.LineQubit.range(2)
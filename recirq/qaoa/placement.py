@@ -93,9 +93,10 @@ def _neighbors_of(qubits: Iterable[cirq.GridQubit], qubit: cirq.GridQubit):
 
 
 def _qubit_index_edges(device: cirq.Device):
-    qubit_to_index_dict = {q: i for i, q in enumerate(sorted(device.qubit_set()))}
-    for q in sorted(device.qubit_set()):
-        for r in _neighbors_of(device.qubit_set(), q):
+    qubits = device.qubit_set()
+    qubit_to_index_dict = {q: i for i, q in enumerate(sorted(qubits))}
+    for q in qubit_to_index_dict:
+        for r in _neighbors_of(qubits, q):
             yield (qubit_to_index_dict[q], qubit_to_index_dict[r])
 
 
@@ -126,7 +127,8 @@ def path_weight(graph: nx.Graph, path,
 
 def min_weight_simple_paths_brute_force(
         graph: nx.Graph,
-        weight_fun: Callable[[nx.Graph, List], float] = path_weight):
+        weight_fun: Callable[[nx.Graph, List], float] = path_weight,
+        max_n: Optional[int] = None):
     """Find all simple paths of various lengths that has minimum total weight
     using brute-force.
 
@@ -139,17 +141,23 @@ def min_weight_simple_paths_brute_force(
         weight_fun: a function that takes (graph, path) and gives a value
             based on edge and node weights that we want to minimize
             (default: uses path_weight)
+        max_n: If specified, only consider paths containing at most this
+            many nodes. The search is pruned at this depth, which is much
+            faster than enumerating every simple path when only short
+            paths are needed.
 
     Returns:
         a dictionary in the form
         {n: path containing n nodes with min weight, or None if doesn't exist}
     """
+    cutoff = None if max_n is None else max_n - 1
     best_weights = defaultdict(lambda: float('inf'))
     best_paths = {}
     nodelist = list(graph.nodes())
     for i in range(len(nodelist) - 1):
         for j in range(i + 1, len(nodelist)):
-            for path in nx.all_simple_paths(graph, nodelist[i], nodelist[j]):
+            for path in nx.all_simple_paths(graph, nodelist[i], nodelist[j],
+                                            cutoff=cutoff):
                 n = len(path)
                 my_weight = weight_fun(graph, path)
                 if my_weight < best_weights[n]:
@@ -162,7 +170,7 @@ def min_weight_simple_path_brute_force(
         graph: nx.Graph,
         n: int,
         weight_fun: Callable[[nx.Graph, List], float] = path_weight):
-    return min_weight_simple_paths_brute_force(graph, weight_fun).get(n, None)
+    return min_weight_simple_paths_brute_force(graph, weight_fun, max_n=n).get(n, None)
 
 
 def join_path(path1, path2):
@@ -349,6 +357,10 @@ class Snake:
     total weight.
     """
 
+    # A new Snake is created for every annealing step, so avoid giving each
+    # one a __dict__.
+    __slots__ = ('graph', 'path', 'weight_fun')
+
     def __init__(self,
                  graph: nx.Graph,
                  path: List,
@@ -550,16 +562,22 @@ def min_weight_simple_paths_mst(
     """
     mst = nx.minimum_spanning_tree(graph)
     path_of_node_pairs = dict(nx.all_pairs_shortest_path(mst))
+    best_weights = {}
     best_paths = {}
+    visited = set()
     for u in path_of_node_pairs:
+        visited.add(u)
         for v in path_of_node_pairs[u]:
-            n = len(path_of_node_pairs[u][v])
-            if n < 2:
+            # The path from v to u is the reverse of the one from u to v,
+            # so don't score it twice.
+            if v in visited:
                 continue
-            if (n not in best_paths
-                    or weight_fun(mst, best_paths[n])
-                    > weight_fun(mst, path_of_node_pairs[u][v])):
-                best_paths[n] = path_of_node_pairs[u][v]
+            path = path_of_node_pairs[u][v]
+            n = len(path)
+            my_weight = weight_fun(mst, path)
+            if n not in best_paths or best_weights[n] > my_weight:
+                best_paths[n] = path
+                best_weights[n] = my_weight
     return best_paths
 
 
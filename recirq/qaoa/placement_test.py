@@ -75,6 +75,20 @@ def test_min_weight_simple_paths_brute_force():
     assert 14 not in bp_brute
 
 
+def test_min_weight_simple_paths_brute_force_max_n():
+    test_graph = nx.grid_2d_graph(4, 4)
+    test_graph.remove_node((3, 0))
+    test_graph.remove_node((0, 3))
+    for e in test_graph.edges:
+        test_graph[e[0]][e[1]]['weight'] = np.random.rand()
+
+    bp_brute = min_weight_simple_paths_brute_force(test_graph)
+    bp_pruned = min_weight_simple_paths_brute_force(test_graph, max_n=5)
+    assert sorted(bp_pruned) == [2, 3, 4, 5]
+    for n in range(2, 6):
+        assert path_weight(test_graph, bp_pruned[n]) == path_weight(test_graph, bp_brute[n])
+
+
 def test_min_weight_simple_path_greedy():
     test_graph = nx.grid_2d_graph(4, 4)
     test_graph.remove_node((3, 0))
@@ -3,6 +3,7 @@ from typing import Sequence, Tuple, List
 import networkx as nx
 
 import cirq
+import cirq.google as cg
 from recirq.qaoa.gates_and_compilation import (
     ProblemUnitary,
     DriverUnitary,
@@ -68,8 +69,8 @@ def get_routed_hardware_grid_circuit(
         qubits=qubits,
         gammas=gammas,
         betas=betas)
-    circuit = compile_problem_unitary_to_hardware_graph(circuit, coordinates)
-    circuit = compile_driver_unitary_to_rx(circuit)
+    circuit = compile_problem_unitary_to_hardware_graph(circuit, coordinates, mutate=True)
+    circuit = compile_driver_unitary_to_rx(circuit, mutate=True)
     return circuit
 
 
@@ -106,11 +107,11 @@ def get_compiled_hardware_grid_circuit(
         coordinates=problem.coordinates,
         gammas=gammas,
         betas=betas)
-    circuit = compile_to_syc(circuit)
+    circuit = compile_to_syc(circuit, mutate=True)
     mcircuit = circuit + cirq.measure(*qubits, key='z')
-    mcircuit = compile_out_virtual_z(mcircuit)
+    mcircuit = compile_out_virtual_z(mcircuit, mutate=True)
     if non_negligible:
-        mcircuit = compile_to_non_negligible(mcircuit)
+        mcircuit = compile_to_non_negligible(mcircuit, mutate=True)
     validate_well_structured(mcircuit)
     final_qubits = qubits.copy()
     return mcircuit, final_qubits
@@ -137,8 +138,8 @@ def get_routed_sk_model_circuit(
     """
     circuit = get_generic_qaoa_circuit(problem_graph, qubits, gammas, betas)
     circuit = compile_problem_unitary_to_swap_network(circuit)
-    circuit = compile_swap_network_to_zzswap(circuit)
-    circuit = compile_driver_unitary_to_rx(circuit)
+    circuit = compile_swap_network_to_zzswap(circuit, mutate=True)
+    circuit = compile_driver_unitary_to_rx(circuit, mutate=True)
     return circuit
 
 
@@ -169,11 +170,11 @@ def get_compiled_sk_model_circuit(
         final_qubits: The qubits in their final logical order.
     """
     circuit = get_routed_sk_model_circuit(problem.graph, qubits, gammas, betas)
-    circuit = compile_to_syc(circuit)
-    mcircuit, final_qubits = measure_with_final_permutation(circuit, qubits)
-    mcircuit = compile_out_virtual_z(mcircuit)
+    circuit = compile_to_syc(circuit, mutate=True)
+    mcircuit, final_qubits = measure_with_final_permutation(circuit, qubits, mutate=True)
+    mcircuit = compile_out_virtual_z(mcircuit, mutate=True)
     if non_negligible:
-        mcircuit = compile_to_non_negligible(mcircuit)
+        mcircuit = compile_to_non_negligible(mcircuit, mutate=True)
     validate_well_structured(mcircuit)
     return mcircuit, final_qubits
 
@@ -202,8 +203,8 @@ def get_routed_3_regular_maxcut_circuit(
         qubits=dummy_qubits,
         gammas=gammas,
         betas=betas)
-    circuit = compile_problem_unitary_to_arbitrary_zz(circuit)
-    circuit = compile_driver_unitary_to_rx(circuit)
+    circuit = compile_problem_unitary_to_arbitrary_zz(circuit, mutate=True)
+    circuit = compile_driver_unitary_to_rx(circuit, mutate=True)
     circuit, initial_qubit_map, final_qubit_map = place_on_device(circuit, device)
     initial_qubits = [initial_qubit_map[q] for q in dummy_qubits]
     final_qubits = [final_qubit_map[q] for q in dummy_qubits]
@@ -231,7 +232,6 @@ def get_compiled_3_regular_maxcut_circuit(
         final_qubits: The qubits in their final logical order.
     """
     # TODO: explicitly compile gates, avoid optimized_for_sycamore, make structured circuits
-    import cirq.google as cg
     initial_qubits, circuit, final_qubits = get_routed_3_regular_maxcut_circuit(
         problem_graph=problem.graph,
         device=device,
@@ -53,8 +53,7 @@ def _graph_to_serializable_edgelist(graph: nx.Graph):
 def _serialized_edgelist_to_graph(edgelist: List[Tuple]):
     """Helper function for deserializing XXProblem instances from JSON."""
     g = nx.Graph()
-    for u, v, w in edgelist:
-        g.add_edge(u, v, weight=w)
+    g.add_weighted_edges_from(edgelist)
     return g
 
 
@@ -119,8 +118,8 @@ def random_plus_minus_1_weights(graph: nx.Graph, rs: Optional[np.random.RandomSt
         raise ValueError("Invalid random state: {}".format(rs))
 
     problem_graph = nx.Graph()
-    for n1, n2 in graph.edges:
-        problem_graph.add_edge(n1, n2, weight=rs.choice([-1, 1]))
+    problem_graph.add_weighted_edges_from(
+        (n1, n2, rs.choice([-1, 1])) for n1, n2 in graph.edges)
     return problem_graph
 
 
@@ -168,15 +167,18 @@ def get_all_hardware_grid_problems(
                                       central_qubit=central_qubit)
     for n_qubits in sorted(subgraphs):
         subgraph = nx.subgraph(device_graph, subgraphs[n_qubits])
+        # Every instance shares the same qubits (those touched by an edge,
+        # as in `random_plus_minus_1_weights`), so only do this once.
+        qubits = sorted({q for edge in subgraph.edges for q in edge})
+        coordinates = [(q.row, q.col) for q in qubits]
+        qubit_to_i = {q: i for i, q in enumerate(qubits)}
         for instance_i in range(n_instances):
             problem = random_plus_minus_1_weights(subgraph, rs=rs)
-            qubits = sorted(problem.nodes)
-            coordinates = [(q.row, q.col) for q in qubits]
-            problem = nx.relabel_nodes(problem, {q: i for i, q in enumerate(qubits)})
+            problem = nx.relabel_nodes(problem, qubit_to_i)
 
             all_hg_problems[n_qubits, instance_i] = HardwareGridProblem(
                 graph=problem,
-                coordinates=coordinates,
+                coordinates=list(coordinates),
             )
 
     return all_hg_problems
@@ -198,15 +198,16 @@ def ising_qaoa_grad(N, HamC, param, flag_z2_sym=False, dtype=np.complex128):
 
     # evaluating gradient analytically
     Fgrad = np.zeros(2 * p)
+    # scratch wavefunction, allocated once and re-zeroed for each q
+    psi_temp = np.empty(psi_p.shape[0], dtype=dtype)
     for q in range(p):
         Fgrad[q] = -2 * np.imag(np.vdot(psi_p[:, q], HamC * psi_p[:, 2 * p + 1 - q]))
 
+        psi_temp.fill(0)
         if not flag_z2_sym:
-            psi_temp = np.zeros(2 ** N, dtype=dtype)
             for i in range(N):
                 psi_temp += multiply_single_spin(psi_p[:, 2 * p - q], N, i, 1, dtype=dtype)
         else:
-            psi_temp = np.zeros(2 ** (N - 1), dtype=dtype)
             for i in range(N - 1):
                 psi_temp += multiply_single_spin(psi_p[:, 2 * p - q], N - 1, i, 1, dtype=dtype)
             psi_temp += np.flipud(psi_p[:, 2 * p - q])
@@ -278,6 +279,21 @@ def _ising_qaoa_expectation(N, HamC, param, flag_z2_sym, dtype):
         N, HamC, param, flag_z2_sym, dtype)[0]
 
 
+# HamC for the current worker process, set once by `_init_grid_worker`
+# so it isn't pickled along with every grid point.
+_grid_worker_HamC = None
+
+
+def _init_grid_worker(HamC):
+    global _grid_worker_HamC
+    _grid_worker_HamC = HamC
+
+
+def _grid_worker_qaoa_expectation(N, param, flag_z2_sym, dtype):
+    return _ising_qaoa_expectation(
+        N, _grid_worker_HamC, param, flag_z2_sym, dtype)
+
+
 def exact_qaoa_values_on_grid(
         graph: nx.Graph,
         xlim: Tuple[float, float] = (0, np.pi / 2),
@@ -305,9 +321,10 @@ def exact_qaoa_values_on_grid(
 
     HamC = create_ZZ_HamC(graph, dtype=dtype)
     N = graph.number_of_nodes()
-    with multiprocessing.Pool(num_processors) as pool:
-        vals = pool.starmap(_ising_qaoa_expectation,
-                            [(N, HamC, x, True, dtype)
+    with multiprocessing.Pool(num_processors, initializer=_init_grid_worker,
+                              initargs=(HamC,)) as pool:
+        vals = pool.starmap(_grid_worker_qaoa_expectation,
+                            [(N, x, True, dtype)
                              for x in itertools.product(gammas, betas)])
     return np.reshape(np.array(vals), (x_grid_num, y_grid_num)).T
 
@@ -338,15 +355,16 @@ def hamiltonian_objectives(
     if readout_calibration:
         if qubit_map is None:
             qubit_map = {q: q for q in nodelist}
-        correction_matrix = np.empty(mat.shape)
-        for i, j in itertools.product(range(len(graph)), repeat=2):
-            p0_i = 1 - readout_calibration.zero_state_errors[qubit_map[nodelist[i]]]
-            p1_i = 1 - readout_calibration.one_state_errors[qubit_map[nodelist[i]]]
-            p0_j = 1 - readout_calibration.zero_state_errors[qubit_map[nodelist[j]]]
-            p1_j = 1 - readout_calibration.one_state_errors[qubit_map[nodelist[j]]]
-            correction_matrix[i, j] = (1 / ((p0_i + p1_i - 1) * (p0_j + p1_j - 1)))
+        # The correction factor is separable: compute it once per node
+        # and take the outer product rather than once per pair of nodes.
+        p0 = 1 - np.asarray([readout_calibration.zero_state_errors[qubit_map[n]]
+                             for n in nodelist])
+        p1 = 1 - np.asarray([readout_calibration.one_state_errors[qubit_map[n]]
+                             for n in nodelist])
+        correction = 1 / (p0 + p1 - 1)
+        correction_matrix = np.outer(correction, correction)
         mat = mat.toarray() * correction_matrix
-    vecs = (-1) ** bitstrings
+    vecs = np.where(bitstrings, -1, 1)
     return 0.5 * np.sum(vecs * (mat @ vecs.T).T, axis=-1)
 
 
@@ -361,17 +379,14 @@ def hamiltonian_objective_avg_and_err(
     assert len(nodelist) == bitstrings.shape[1]
     node_to_i = {n: i for i, n in enumerate(nodelist)}
 
-    vecs = (-1) ** bitstrings
-    coeffs = []
-    vars = []
-    for n1, n2, w in graph.edges.data('weight'):
-        coeffs += [w]
-        i1 = node_to_i[n1]
-        i2 = node_to_i[n2]
-        vars += [vecs[:, i1] * vecs[:, i2]]
-
-    vars = np.asarray(vars)
-    coeffs = np.asarray(coeffs)[np.newaxis, :]
+    vecs = np.where(bitstrings, -1, 1)
+    edges = list(graph.edges.data('weight'))
+    i1 = [node_to_i[n1] for n1, _, _ in edges]
+    i2 = [node_to_i[n2] for _, n2, _ in edges]
+
+    # One row of ZZ values per edge, gathered for all edges at once
+    vars = (vecs[:, i1] * vecs[:, i2]).T
+    coeffs = np.asarray([w for _, _, w in edges])[np.newaxis, :]
     f = coeffs @ np.mean(vars, axis=1)
     f = f.item()  # to normal float
     var = coeffs @ np.atleast_2d(np.cov(vars)) @ coeffs.T
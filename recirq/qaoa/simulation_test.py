@@ -97,6 +97,44 @@ def test_hamiltonian_objectives_consistent():
     np.testing.assert_allclose(expected_energies, actual_energies)
 
 
+def test_hamiltonian_objectives_readout_correction():
+    n = 6
+    graph = random_plus_minus_1_weights(nx.complete_graph(n=n),
+                                        rs=np.random.RandomState(52))
+    qubits = cirq.GridQubit.rect(2, 3)
+    qubit_map = {i: qubits[n - 1 - i] for i in range(n)}
+    rs = np.random.RandomState(53)
+    readout_calibration = cirq.experiments.SingleQubitReadoutCalibrationResult(
+        zero_state_errors={q: rs.uniform(0, 0.1) for q in qubits},
+        one_state_errors={q: rs.uniform(0, 0.1) for q in qubits},
+        repetitions=1000,
+        timestamp=0.0)
+    bitstrings = rs.choice([True, False], size=(100, n))
+
+    # Reference: the per-pair correction formula
+    nodelist = sorted(graph.nodes)
+    correction_matrix = np.empty((n, n))
+    for i in range(n):
+        for j in range(n):
+            p0_i = 1 - readout_calibration.zero_state_errors[qubit_map[nodelist[i]]]
+            p1_i = 1 - readout_calibration.one_state_errors[qubit_map[nodelist[i]]]
+            p0_j = 1 - readout_calibration.zero_state_errors[qubit_map[nodelist[j]]]
+            p1_j = 1 - readout_calibration.one_state_errors[qubit_map[nodelist[j]]]
+            correction_matrix[i, j] = 1 / ((p0_i + p1_i - 1) * (p0_j + p1_j - 1))
+    mat = nx.adjacency_matrix(graph, nodelist=nodelist).toarray() * correction_matrix
+    vecs = (-1) ** bitstrings
+    expected_energies = 0.5 * np.sum(vecs * (mat @ vecs.T).T, axis=-1)
+
+    actual_energies = hamiltonian_objectives(
+        bitstrings, graph,
+        readout_calibration=readout_calibration,
+        qubit_map=qubit_map)
+    np.testing.assert_allclose(expected_energies, actual_energies)
+    # Make sure the correction actually did something
+    assert not np.allclose(actual_energies,
+                           hamiltonian_objectives(bitstrings, graph))
+
+
 def test_hamiltonian_objective_avg_and_var():
     bitstrings = np.array([[1, 0, 1, 0, 1],
                            [0, 1, 1, 1, 0],
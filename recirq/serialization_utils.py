@@ -115,6 +115,10 @@ class NumpyArray:
         return f'recirq.NumpyArray({repr(self.a)})'
 
     def __eq__(self, other):
+        if self is other:
+            return True
+        if not isinstance(other, type(self)):
+            return NotImplemented
         return np.array_equal(self.a, other.a)
 
 
@@ -155,6 +159,10 @@ class BitArray:
         return f'recirq.BitArray({repr(self.bits)})'
 
     def __eq__(self, other):
+        if self is other:
+            return True
+        if not isinstance(other, type(self)):
+            return NotImplemented
         return np.array_equal(self.bits, other.bits)
 
 
@@ -214,12 +222,14 @@ def json_serializable_dataclass(_cls: Optional[Type] = None,
     return wrap(_cls)
 
 
+_RECIRQ_CLASSES = {
+    'recirq.BitArray': BitArray,
+    'recirq.NumpyArray': NumpyArray,
+}
+
+
 def _recirq_class_resolver(cirq_type: str) -> Union[None, Type]:
-    from recirq import BitArray, NumpyArray
-    return {
-        'recirq.BitArray': BitArray,
-        'recirq.NumpyArray': NumpyArray,
-    }.get(cirq_type)
+    return _RECIRQ_CLASSES.get(cirq_type)
 
 
 DEFAULT_RESOLVERS = [_recirq_class_resolver, Registry.get] \
@@ -92,6 +92,22 @@ def test_numpy_roundtrip(tmpdir):
     assert ba == ba2
 
 
+def test_eq():
+    bits = np.array([0, 1, 0, 1])
+    ba = recirq.BitArray(bits)
+    assert ba == ba
+    assert ba == recirq.BitArray(bits.copy())
+    assert ba != recirq.BitArray(np.array([1, 1, 0, 1]))
+    assert ba != recirq.NumpyArray(bits)
+    assert ba != 'recirq.BitArray'
+
+    na = recirq.NumpyArray(np.array([1, 2, 3]))
+    assert na == na
+    assert na == recirq.NumpyArray(np.array([1, 2, 3]))
+    assert na != recirq.NumpyArray(np.array([1, 2, 4]))
+    assert na != 5
+
+
 def test_str_and_repr():
     bits = np.array([0, 1, 0, 1])
     assert str(recirq.BitArray(bits)) == 'recirq.BitArray([0 1 0 1])'